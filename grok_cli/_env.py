@@ -0,0 +1,75 @@
+"""
+Environment loading for Grok CLI
+Parses .env files once per process and only re-reads them when they change on disk
+"""
+
+import os
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from typing import Optional
+
+from dotenv import dotenv_values, find_dotenv
+
+
+@lru_cache(maxsize=8)
+def _parse_env(path, mtime_ns):
+    """Parse a .env file; cached per (path, mtime) so unchanged files are read once"""
+    return dotenv_values(path)
+
+
+def load_env(path=None):
+    """Load a .env file into os.environ without overriding variables already set"""
+    path = path or find_dotenv()
+    if not path:
+        return {}
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+
+    values = _parse_env(path, mtime_ns)
+    for key, value in values.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    return dict(values)
+
+
+@dataclass(frozen=True)
+class GrokEnvConfig:
+    """Snapshot of the GROK_* environment variables with types already coerced"""
+    api_key: Optional[str] = field(default=None, metadata={"env": "GROK_API_KEY", "label": "API Key"})
+    model: str = field(default="grok-4-0709", metadata={"env": "GROK_MODEL", "label": "Model"})
+    base_url: str = field(default="https://api.x.ai/v1", metadata={"env": "GROK_BASE_URL", "label": "Base URL"})
+    temperature: float = field(default=0.7, metadata={"env": "GROK_TEMPERATURE", "label": "Temperature"})
+    max_tokens: int = field(default=1000, metadata={"env": "GROK_MAX_TOKENS", "label": "Max Tokens"})
+    verbose: bool = field(default=False, metadata={"env": "GROK_VERBOSE", "label": "Verbose Mode"})
+    memory_window: int = field(default=10, metadata={"env": "GROK_MEMORY_WINDOW", "label": "Memory Window"})
+    max_iterations: int = field(default=5, metadata={"env": "GROK_MAX_ITERATIONS", "label": "Max Iterations"})
+
+
+def _parse(env, name, cast, default):
+    """Coerce one GROK_* variable, naming it in the error if its value is invalid"""
+    raw = env.get(name)
+    if raw is None:
+        return default
+    try:
+        return cast(raw)
+    except ValueError:
+        raise ValueError(f"{name}={raw!r} is not a valid {cast.__name__}") from None
+
+
+@cache
+def env_config():
+    """Read the GROK_* variables once per process, loading the default .env first"""
+    load_env()
+    env = os.environ
+    return GrokEnvConfig(
+        api_key=env.get("GROK_API_KEY"),
+        model=env.get("GROK_MODEL", "grok-4-0709"),
+        base_url=env.get("GROK_BASE_URL", "https://api.x.ai/v1"),
+        temperature=_parse(env, "GROK_TEMPERATURE", float, 0.7),
+        max_tokens=_parse(env, "GROK_MAX_TOKENS", int, 1000),
+        verbose=env.get("GROK_VERBOSE", "False").lower() == "true",
+        memory_window=_parse(env, "GROK_MEMORY_WINDOW", int, 10),
+        max_iterations=_parse(env, "GROK_MAX_ITERATIONS", int, 5),
+    )
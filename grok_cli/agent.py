@@ -1,56 +1,242 @@
-from langchain.agents import create_openai_functions_agent, AgentExecutor
-from langchain import hub
-from langchain_openai import ChatOpenAI
-from langchain.memory import ConversationBufferMemory
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from composio_langchain import ComposioToolSet, App
+import asyncio
+import os
+import re
+import sys
+from functools import cache, lru_cache
+
+from ._env import env_config
+
+# LangChain/Composio are imported on first agent construction so that CLI
+# commands which never build an agent don't pay for the import graph
+_IMPORTED = False
+
+_SYSTEM_MESSAGES = [
+    ("system", "You are a helpful AI assistant with access to file tools. Use the tools when needed to help the user. "
+               "When several tool calls don't depend on each other, prefer running them together through the `batch` tool."),
+    ("placeholder", "{chat_history}"),
+    ("user", "{input}"),
+    ("placeholder", "{agent_scratchpad}"),
+]
+
+_RATE_LIMIT_RE = re.compile(r"rate.?limit|\b429\b", re.I)
+
+def _error_message(e):
+    """User-facing message for an exception raised during a chat turn"""
+    from openai import RateLimitError
+    
+    # The typed check covers the common case without formatting the error;
+    # the regex still catches rate limits wrapped by LangChain or Composio
+    if isinstance(e, RateLimitError) or _RATE_LIMIT_RE.search(str(e)):
+        return "Rate limit exceeded. Please try again later."
+    return f"An error occurred: {str(e)}"
+
+# Compiled once alongside the lazy imports and shared by every GrokAgent
+_PROMPT = None
+
+def _lazy_imports():
+    """Bind the heavy LangChain/Composio names into module globals once"""
+    global _IMPORTED, _PROMPT, create_tool_calling_agent, AgentExecutor, ChatOpenAI
+    global ConversationBufferWindowMemory, ComposioToolSet, App, make_batch_tool, StdoutTokens
+    if _IMPORTED:
+        return
+    from langchain.agents import create_tool_calling_agent, AgentExecutor
+    from langchain_openai import ChatOpenAI
+    from langchain.memory import ConversationBufferWindowMemory
+    from langchain_core.prompts import ChatPromptTemplate
+    from composio_langchain import ComposioToolSet, App
+    from .batch_tool import make_batch_tool
+    from .streaming import StdoutTokens
+    _PROMPT = ChatPromptTemplate.from_messages(_SYSTEM_MESSAGES)
+    _IMPORTED = True
+
+@cache
+def _http_client():
+    """Pooled HTTP/2 client shared by every ChatOpenAI so connections are reused"""
+    import httpx
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+
+@cache
+def _composio_toolset():
+    """Shared ComposioToolSet for all GrokAgent instances"""
+    return ComposioToolSet()
+
+@lru_cache(maxsize=None)
+def _app_member(app_name):
+    """Resolve a Composio App member by name, reflecting on App only once per name"""
+    return getattr(App, app_name.upper())
+
+@lru_cache(maxsize=32)
+def _get_composio_tools(app_names):
+    """Fetch Composio tools once per sorted tuple of App names"""
+    return tuple(_composio_toolset().get_tools(apps=[_app_member(name) for name in app_names]))
 
 class GrokAgent:
-    def __init__(self, api_key, model="grok-4-0709", base_url="https://api.x.ai/v1"):
+    DEFAULT_COMPOSIO_APPS = ("FILETOOL",)
+    CUSTOM_TOOL_COUNT = 1  # the `batch` tool
+    
+    def __init__(self, api_key=None, model=None, base_url=None, temperature=None, max_tokens=None, verbose=None, memory_window=None, trace=False):
+        # Fall back to the cached GROK_* environment snapshot (this also loads
+        # .env before LangChain/Composio read their own settings)
+        cfg = env_config()
+        
+        # LangChain tracing and callback dispatch cost time on every step;
+        # keep them off unless explicitly requested
+        if trace:
+            os.environ["LANGCHAIN_TRACING_V2"] = "true"
+        else:
+            os.environ.setdefault("LANGCHAIN_TRACING_V2", "false")
+        os.environ.setdefault("LANGCHAIN_CALLBACKS_BACKGROUND", "true")
+        self._run_config = None if trace else {"callbacks": [], "tags": []}
+        
+        _lazy_imports()
+        
+        self.api_key = api_key or cfg.api_key
+        self.model = model or cfg.model
+        self.base_url = base_url or cfg.base_url
+        self.temperature = temperature if temperature is not None else cfg.temperature
+        self.max_tokens = max_tokens if max_tokens is not None else cfg.max_tokens
+        self.verbose = verbose if verbose is not None else cfg.verbose
+        self.memory_window = memory_window if memory_window is not None else cfg.memory_window
+        self.max_iterations = cfg.max_iterations
+        
+        if not self.api_key:
+            raise ValueError("GROK_API_KEY must be provided either as parameter or in .env file")
+        
         self.llm = ChatOpenAI(
-            api_key=api_key,
-            model=model,
-            base_url=base_url,
-            temperature=0.7,
-            max_tokens=1000
+            api_key=self.api_key,
+            model=self.model,
+            base_url=self.base_url,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            streaming=True,
+            http_client=_http_client(),
+            # Let the model request several independent tools in one turn
+            model_kwargs={"parallel_tool_calls": True}
         )
         
-        self.composio_toolset = ComposioToolSet()
-        self.tools = self.composio_toolset.get_tools(apps=[App.FILETOOL])
+        self.composio_toolset = _composio_toolset()
+        # Copy the cached tuple so per-instance changes don't leak into the cache
+        self.tools = list(_get_composio_tools(tuple(sorted(self.DEFAULT_COMPOSIO_APPS))))
+        self._tools_by_name = {tool.name: tool for tool in self.tools}
+        self.tools.append(make_batch_tool(self._tools_by_name))
         
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a helpful AI assistant with access to file tools. Use the tools when needed to help the user."),
-            MessagesPlaceholder(variable_name="chat_history"),
-            ("user", "{input}"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ])
+        self.prompt = _PROMPT
         
-        self.memory = ConversationBufferMemory(
+        # Keep only the last few exchanges so prompt size stays bounded per turn
+        self.memory = ConversationBufferWindowMemory(
             memory_key="chat_history",
-            return_messages=True
+            return_messages=True,
+            k=self.memory_window
         )
         
-        self.agent = create_openai_functions_agent(self.llm, self.tools, prompt)
+        self._build_executor()
+    
+    def _build_executor(self):
+        """(Re)bind the current tool list into the agent, keeping conversation memory"""
+        self.agent = create_tool_calling_agent(self.llm, self.tools, self.prompt)
         self.agent_executor = AgentExecutor(
             agent=self.agent,
             tools=self.tools,
             memory=self.memory,
-            verbose=False,  
-            max_iterations=10
+            verbose=self.verbose,  
+            max_iterations=self.max_iterations,
+            return_intermediate_steps=False,
+            handle_parsing_errors=True
         )
     
+    def add_tool(self, app_name):
+        """Add the tools of another Composio app (e.g. 'SHELLTOOL') to the agent"""
+        try:
+            _app_member(app_name)
+        except AttributeError:
+            print(f"❌ Unknown Composio app: {app_name}")
+            return []
+        app_tools = _get_composio_tools((app_name.upper(),))
+        
+        new_tools = [tool for tool in app_tools if tool.name not in self._tools_by_name]
+        if new_tools:
+            self.tools.extend(new_tools)
+            self._tools_by_name.update((tool.name, tool) for tool in new_tools)
+            self._build_executor()
+        return new_tools
+    
+    def list_available_tools(self):
+        """List all available tools"""
+        lines = ["🛠️  **Available Tools**", "=" * 50]
+        lines.extend(f"  • {tool.name}: {tool.description}" for tool in self.tools)
+        print("\n".join(lines))
+        return self.tools
+    
+    def get_config(self):
+        """Get current configuration"""
+        return {
+            "model": self.model,
+            "base_url": self.base_url,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "verbose": self.verbose,
+            "api_key_set": bool(self.api_key),
+            "total_tools": len(self.tools)
+        }
+    
+    def _streaming_config(self, tokens):
+        """Run config that prints LLM tokens through `tokens` as they arrive"""
+        return {**(self._run_config or {}), "callbacks": [tokens]}
+    
     def chat(self, user_message):
         """Chat with the agent using LangChain's built-in tool calling"""
+        tokens = StdoutTokens()
+        try:
+            response = self.agent_executor.invoke({"input": user_message}, config=self._streaming_config(tokens))
+            return tokens.finish(response.get("output"))
+        except Exception as e:
+            error_msg = _error_message(e)
+            print(error_msg)
+            return error_msg
+    
+    async def achat(self, user_message):
+        """Async counterpart of chat() for use inside an event loop"""
+        tokens = StdoutTokens()
         try:
-            response = self.agent_executor.invoke({"input": user_message})
-            output = response.get("output", "Sorry, I couldn't generate a response.")
-            print(output)  
-            return output
+            response = await self.agent_executor.ainvoke({"input": user_message}, config=self._streaming_config(tokens))
+            return tokens.finish(response.get("output"))
         except Exception as e:
-            if "rate_limit" in str(e).lower() or "429" in str(e):
-                error_msg = "Rate limit exceeded. Please try again later."
-                print(error_msg)
-                return error_msg
-            error_msg = f"An error occurred: {str(e)}"
+            error_msg = _error_message(e)
             print(error_msg)
-            return error_msg
\ No newline at end of file
+            return error_msg
+    
+    def chat_batch(self, messages, max_concurrency=5):
+        """Run independent prompts concurrently and return their outputs in order
+        
+        Batch prompts don't read or write the conversation memory, since
+        ConversationBufferWindowMemory isn't safe for concurrent writes.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        
+        executor = AgentExecutor(
+            agent=self.agent,
+            tools=self.tools,
+            verbose=self.verbose,
+            max_iterations=self.max_iterations,
+            return_intermediate_steps=False,
+            handle_parsing_errors=True
+        )
+        
+        async def _run():
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def _achat_one(message):
+                async with semaphore:
+                    try:
+                        response = await executor.ainvoke({"input": message, "chat_history": []}, config=self._run_config)
+                        return response.get("output", "Sorry, I couldn't generate a response.")
+                    except Exception as e:
+                        return _error_message(e)
+            
+            return await asyncio.gather(*(_achat_one(m) for m in messages))
+        
+        return asyncio.run(_run())
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+Batch tool for Grok agents
+Lets the model run several independent tool calls in a single turn
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel, Field
+
+
+class ToolInvocation(BaseModel):
+    tool_name: str = Field(description="Name of the tool to call")
+    arguments: dict = Field(default_factory=dict, description="Arguments to pass to the tool")
+
+
+class BatchInput(BaseModel):
+    invocations: list[ToolInvocation] = Field(description="Independent tool calls to run in parallel")
+
+
+# Composio tools without side effects or workspace state; everything else
+# (shell commands, writes, opening files, changing directory) runs in order
+_READ_ONLY_TOOLS = frozenset({
+    "FILETOOL_LIST_FILES",
+    "FILETOOL_FIND_FILE",
+    "FILETOOL_SEARCH_WORD",
+})
+
+
+def _tool_name(invocation):
+    """Tool name of a raw or validated invocation, or None if it has none"""
+    if isinstance(invocation, dict):
+        return invocation.get("tool_name")
+    return getattr(invocation, "tool_name", None)
+
+
+def make_batch_tool(tools_by_name, max_workers=8, read_only_tools=_READ_ONLY_TOOLS):
+    """Create a `batch` tool that runs calls to the given tools in one turn
+
+    Consecutive calls to `read_only_tools` run concurrently; any other call
+    waits for them, runs on its own, and keeps its place in the order.
+    `tools_by_name` is read at call time, so tools added to the agent later
+    are reachable through the batch tool as well.
+    """
+    def _run_one(invocation):
+        try:
+            if isinstance(invocation, dict):
+                invocation = ToolInvocation(**invocation)
+            tool = tools_by_name.get(invocation.tool_name)
+            if tool is None:
+                return f"Unknown tool: {invocation.tool_name}"
+            return tool.invoke(invocation.arguments)
+        except Exception as e:
+            return f"An error occurred: {str(e)}"
+
+    def batch(invocations):
+        results = [None] * len(invocations)
+        pending = {}
+
+        def _drain():
+            for future in as_completed(pending):
+                results[pending[future]] = future.result()
+            pending.clear()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for index, invocation in enumerate(invocations):
+                if _tool_name(invocation) in read_only_tools:
+                    pending[pool.submit(_run_one, invocation)] = index
+                else:
+                    _drain()
+                    results[index] = _run_one(invocation)
+            _drain()
+        return json.dumps(results, default=str)
+
+    return StructuredTool.from_function(
+        func=batch,
+        name="batch",
+        description=(
+            "Run several independent tool calls in one step. Each invocation names a tool "
+            "and its arguments; read-only lookups run in parallel, other calls run one at a "
+            "time in the given order. Results are returned as a JSON list in the same order."
+        ),
+        args_schema=BatchInput,
+    )
@@ -4,44 +4,158 @@ Command-line interface for Grok CLI with MCP server support and project-aware de
 Enhanced version with filesystem tools, MCP integration, and project-aware capabilities like Claude Code
 """
 
-import click
+import argparse
+import importlib
 import os
-from dotenv import load_dotenv
+import sys
+from dataclasses import fields
+from functools import lru_cache
 from pathlib import Path
 
-# Load environment variables
-load_dotenv()
+from ._env import GrokEnvConfig, env_config, load_env
 
-@click.group()
-@click.version_option()
-def cli():
-    """🚀 Grok CLI - AI Assistant with Enhanced Capabilities
+_QUIT_COMMANDS = frozenset({'quit', 'exit', 'bye'})
+
+# Emoji for banners and prompts, with ASCII fallbacks for terminals whose
+# encoding can't represent them (or when --no-emoji is passed)
+_TAGS = {
+    'rocket': ('🚀', '>>'),
+    'folder': ('📁', '[dir]'),
+    'pin': ('📍', '[path]'),
+    'search': ('🔍', '[lang]'),
+    'tools': ('🛠️ ', '[fw]'),
+    'chart': ('📊', '[info]'),
+    'clipboard': ('📋', '[git]'),
+    'speech': ('💬', '>'),
+    'bulb': ('💡', '[tip]'),
+    'target': ('🎯', '>'),
+    'you': ('🗣️  You:', 'You:'),
+    'assistant': ('🤖 Assistant:', 'Assistant:'),
+}
+
+def _tags(emoji):
+    """Pick the emoji or ASCII form of every banner tag"""
+    return {name: forms[0] if emoji else forms[1] for name, forms in _TAGS.items()}
+
+def _stdout_is_utf8():
+    """Whether stdout can encode emoji"""
+    return 'utf' in (getattr(sys.stdout, 'encoding', None) or '').lower()
+
+_TAG = _tags(_stdout_is_utf8())
+
+# ASCII stand-ins for the status glyphs printed inline by the CLI and agents
+_ASCII_GLYPHS = str.maketrans({
+    '🚀': '>>', '📁': '[dir]', '📍': '[path]', '🔍': '[lang]', '🛠': '[tools]',
+    '📊': '[info]', '📋': '[git]', '💬': '>', '💡': '[tip]', '🎯': '>',
+    '🗣': '', '🤖': '[bot]', '📄': '[cfg]', '⚙': '[cfg]', '👋': '[bye]',
+    '🔌': '[mcp]', '📡': '[srv]', '🎮': '[demo]', '✨': '[+]', '📦': '[pkg]',
+    '🧪': '[test]', '🔧': '[test]', '✅': '[ok]', '❌': '[x]', '⚪': '[-]',
+    '⚠': '[!]', '•': '*', '\ufe0f': None,
+})
+
+class _AsciiStdout:
+    """Proxy for sys.stdout that swaps emoji for their ASCII stand-ins on write"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        return self._stream.write(text.translate(_ASCII_GLYPHS))
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+_DEV_BANNER = "\n".join([
+    "{rocket} " + "=" * 60,
+    "   GROK CLI - PROJECT-AWARE DEVELOPMENT MODE",
+    "=" * 60,
+])
+
+_DEV_READY = "\n".join([
+    "=" * 60,
+    "{speech} Ready for development! Ask me to:",
+    "   • Analyze your codebase",
+    "   • Fix merge conflicts",
+    "   • Debug issues",
+    "   • Refactor code",
+    "   • Run tests or builds",
+    "{bulb} Type 'quit', 'exit', or press Ctrl+C to stop.",
+    "=" * 60,
+])
+
+_CHAT_BANNER = "\n".join([
+    "{rocket} " + "=" * 60,
+    "   GROK CLI - AI Assistant with Enhanced Capabilities",
+    "=" * 60,
+])
+
+_CHAT_READY = "\n".join([
+    "=" * 60,
+    "{speech} Start chatting! Type 'quit', 'exit', or press Ctrl+C to stop.",
+])
+
+_MCP_COMMANDS_HINT = "{bulb} MCP Commands: 'activate server_name', 'deactivate server_name', 'mcp status'"
+
+def _disable_emoji():
+    """Switch all output to ASCII glyphs; anything else unencodable is replaced, not raised"""
+    global _TAG
+    _TAG = _tags(False)
+    if isinstance(sys.stdout, _AsciiStdout):
+        return
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(errors='replace')
+    sys.stdout = _AsciiStdout(sys.stdout)
+
+# Agent classes in order of preference for `tools`, most capable first
+_AGENTS = (
+    ('MCP-Enhanced', 'grok_cli.mcp_enhanced_agent', 'MCPEnhancedGrokAgent'),
+    ('Enhanced', 'grok_cli.enhanced_agent', 'EnhancedGrokAgent'),
+    ('Standard', 'grok_cli.agent', 'GrokAgent'),
+)
+
+# Every agent class, for metadata-only listings
+_ALL_AGENTS = _AGENTS + (
+    ('Project-Aware', 'grok_cli.project_agent', 'ProjectAwareGrokAgent'),
+)
+
+@lru_cache(maxsize=None)
+def _agent_class(module_name, class_name):
+    """Import an agent class by name, once per process"""
+    return getattr(importlib.import_module(module_name), class_name)
+
+@lru_cache(maxsize=None)
+def _default_agent(module_name, class_name):
+    """Build a default-configured agent, reused on later calls in this process"""
+    return _agent_class(module_name, class_name)()
+
+def _run_script(script, *args):
+    """Run a test script in this interpreter instead of forking a new Python"""
+    import runpy
+    
+    if not os.path.exists(script):
+        print(f"❌ {script} not found in {os.getcwd()}")
+        return 1
     
-    A powerful command-line AI assistant that combines:
-    • Composio file and shell tools
-    • Enhanced filesystem operations
-    • MCP (Model Context Protocol) server integration
-    • Direct filesystem access
-    • Project-aware development
-    • Git integration and merge conflict resolution
-    • Context-aware coding assistance
-    """
-    pass
-
-@cli.command()
-@click.option('--project-path', type=click.Path(exists=True), help='Path to project directory (defaults to current)')
-@click.option('--config', type=click.Path(), help='Path to .env configuration file')
-@click.option('--temperature', type=float, help='Model temperature (0.0-2.0)')
-@click.option('--max-tokens', type=int, help='Maximum tokens in response')
-@click.option('--verbose', is_flag=True, help='Enable verbose mode')
+    # Match `python script`: argv and the script's directory first on sys.path
+    saved_argv, saved_path = sys.argv, sys.path[:]
+    sys.argv = [script, *args]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        return e.code
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+    return 0
+
 def dev(project_path, config, temperature, max_tokens, verbose):
     """Start project-aware development mode (like Claude Code)"""
     
     # Load custom config if provided
     if config:
-        from dotenv import load_dotenv
-        load_dotenv(config)
-        click.echo(f"📄 Loaded configuration from: {config}")
+        load_env(config)
+        print(f"📄 Loaded configuration from: {config}")
     
     # Set project path
     if project_path:
@@ -49,11 +163,13 @@ def dev(project_path, config, temperature, max_tokens, verbose):
     else:
         project_path = Path.cwd()
     
-    click.echo("🚀 " + "="*60)
-    click.echo("   GROK CLI - PROJECT-AWARE DEVELOPMENT MODE")
-    click.echo("="*60)
-    click.echo(f"📁 Project: {project_path.name}")
-    click.echo(f"📍 Path: {project_path}")
+    tag = _TAG
+    sys.stdout.write(
+        f"{_DEV_BANNER.format_map(tag)}\n"
+        f"{tag['folder']} Project: {project_path.name}\n"
+        f"{tag['pin']} Path: {project_path}\n"
+    )
+    sys.stdout.flush()
     
     # Initialize project-aware agent
     try:
@@ -68,79 +184,76 @@ def dev(project_path, config, temperature, max_tokens, verbose):
         
         # Show project analysis
         project_info = agent.get_project_info()
-        click.echo(f"🔍 Languages: {', '.join(project_info['languages']) if project_info['languages'] else 'Unknown'}")
-        click.echo(f"🛠️  Frameworks: {', '.join(project_info['frameworks']) if project_info['frameworks'] else 'None detected'}")
-        click.echo(f"📊 Files: {project_info['file_count']} files found")
-        click.echo(f"📋 Git: {'Yes' if project_info['is_git_repo'] else 'No'}")
-        
-        click.echo("="*60)
-        click.echo("💬 Ready for development! Ask me to:")
-        click.echo("   • Analyze your codebase")
-        click.echo("   • Fix merge conflicts")
-        click.echo("   • Debug issues")
-        click.echo("   • Refactor code")
-        click.echo("   • Run tests or builds")
-        click.echo("💡 Type 'quit', 'exit', or press Ctrl+C to stop.")
-        click.echo("="*60)
+        sys.stdout.write(
+            f"{tag['search']} Languages: {', '.join(project_info['languages']) if project_info['languages'] else 'Unknown'}\n"
+            f"{tag['tools']} Frameworks: {', '.join(project_info['frameworks']) if project_info['frameworks'] else 'None detected'}\n"
+            f"{tag['chart']} Files: {project_info['file_count']} files found\n"
+            f"{tag['clipboard']} Git: {'Yes' if project_info['is_git_repo'] else 'No'}\n"
+            f"{_DEV_READY.format_map(tag)}\n"
+        )
         
-        # Interactive development loop
+        # Interactive development loop; same PromptSession editing and
+        # history as chat
+        from prompt_toolkit import PromptSession
+        session = PromptSession(enable_history_search=True)
+        dev_prompt = f"{tag['target']} {project_path.name}> "
         while True:
             try:
-                user_input = input(f"\n🎯 {project_path.name}> ").strip()
+                print()
+                user_input = session.prompt(dev_prompt).strip()
+                lowered = user_input.lower()
                 
-                if user_input.lower() in ['quit', 'exit', 'bye']:
-                    click.echo("👋 Happy coding!")
+                if lowered in _QUIT_COMMANDS:
+                    print("👋 Happy coding!")
                     break
                 
-                if user_input.lower() == 'status':
+                if lowered == 'status':
                     project_info = agent.get_project_info()
-                    click.echo(f"\n📊 **Project Status:**")
-                    click.echo(f"   Current directory: {project_info['current_dir']}")
-                    click.echo(f"   Languages: {', '.join(project_info['languages'])}")
-                    click.echo(f"   Frameworks: {', '.join(project_info['frameworks'])}")
+                    print(f"\n📊 **Project Status:**")
+                    print(f"   Current directory: {project_info['current_dir']}")
+                    print(f"   Languages: {', '.join(project_info['languages'])}")
+                    print(f"   Frameworks: {', '.join(project_info['frameworks'])}")
                     continue
                 
-                if user_input.lower() == 'tools':
+                if lowered == 'tools':
                     agent.list_available_tools()
                     continue
                 
                 if user_input:
-                    click.echo("\n🤖 Assistant:")
+                    print(f"\n{tag['assistant']}")
                     agent.chat(user_input)
                     
-            except KeyboardInterrupt:
-                click.echo("\n👋 Happy coding!")
+            except (KeyboardInterrupt, EOFError):
+                print("\n👋 Happy coding!")
                 break
             except Exception as e:
-                click.echo(f"❌ Error: {e}")
+                print(f"❌ Error: {e}")
                 
     except ImportError as e:
-        click.echo(f"❌ Import error: {e}")
-        click.echo("💡 Make sure all dependencies are installed: pip install -r requirements.txt")
+        print(f"❌ Import error: {e}")
+        print("💡 Make sure all dependencies are installed: pip install -r requirements.txt")
     except Exception as e:
-        click.echo(f"❌ Initialization error: {e}")
-        click.echo("💡 Check your .env file and API key configuration")
-
-@cli.command()
-@click.option('--config', type=click.Path(), help='Path to .env configuration file')
-@click.option('--temperature', type=float, help='Model temperature (0.0-2.0)')
-@click.option('--max-tokens', type=int, help='Maximum tokens in response')
-@click.option('--verbose', is_flag=True, help='Enable verbose mode')
-@click.option('--enhanced', is_flag=True, default=True, help='Use enhanced agent with filesystem tools')
-@click.option('--mcp', is_flag=True, help='Use MCP-enhanced agent')
-def chat(config, temperature, max_tokens, verbose, enhanced, mcp):
+        print(f"❌ Initialization error: {e}")
+        print("💡 Check your .env file and API key configuration")
+
+def chat(config, temperature, max_tokens, verbose, enhanced, mcp, trace, memory_window, batch, concurrency):
     """Start interactive chat with the AI assistant"""
     
     # Load custom config if provided
     if config:
-        from dotenv import load_dotenv
-        load_dotenv(config)
-        click.echo(f"📄 Loaded configuration from: {config}")
+        load_env(config)
+        print(f"📄 Loaded configuration from: {config}")
+    
+    # Options that only the standard agent understands
+    standard = not mcp and (batch or not enhanced)
+    unsupported = [flag for flag, used in (('--memory-window', memory_window is not None), ('--trace', trace)) if used]
+    if unsupported and not standard:
+        print(f"❌ {' and '.join(unsupported)} only work with the standard agent; add --no-enhanced or use --batch")
+        return 2
     
     # Display startup banner
-    click.echo("🚀 " + "="*60)
-    click.echo("   GROK CLI - AI Assistant with Enhanced Capabilities")
-    click.echo("="*60)
+    tag = _TAG
+    print(_CHAT_BANNER.format_map(tag), flush=True)
     
     # Initialize the appropriate agent
     try:
@@ -151,177 +264,217 @@ def chat(config, temperature, max_tokens, verbose, enhanced, mcp):
                 max_tokens=max_tokens,
                 verbose=verbose
             )
-            click.echo("🔌 MCP-Enhanced agent initialized with specialized server support")
-        elif enhanced:
+            print("🔌 MCP-Enhanced agent initialized with specialized server support")
+        elif enhanced and not batch:
             from .enhanced_agent import EnhancedGrokAgent
             agent = EnhancedGrokAgent(
                 temperature=temperature,
                 max_tokens=max_tokens,
                 verbose=verbose
             )
-            click.echo("✨ Enhanced agent initialized with filesystem tools")
+            print("✨ Enhanced agent initialized with filesystem tools")
         else:
             from .agent import GrokAgent
             agent = GrokAgent(
                 temperature=temperature,
                 max_tokens=max_tokens,
-                verbose=verbose
+                verbose=verbose,
+                memory_window=memory_window,
+                trace=trace
             )
-            click.echo("🤖 Standard agent initialized")
+            print("🤖 Standard agent initialized")
+        
+        if batch:
+            if not hasattr(agent, 'chat_batch'):
+                print("❌ Batch mode is not supported by the MCP-enhanced agent")
+                return
+            prompts = [line.strip() for line in Path(batch).read_text().splitlines() if line.strip()]
+            print(f"📦 Running {len(prompts)} prompts (concurrency {concurrency})...")
+            outputs = agent.chat_batch(prompts, max_concurrency=concurrency)
+            for prompt, output in zip(prompts, outputs):
+                print(f"\n🗣️  You: {prompt}")
+                print(f"{tag['assistant']} {output}")
+            return
         
         # Show configuration
         config_info = agent.get_config()
-        click.echo(f"📊 Model: {config_info['model']} | Tools: {config_info.get('total_tools', 'N/A')}")
+        lines = [f"📊 Model: {config_info['model']} | Tools: {config_info.get('total_tools', 'N/A')}"]
         
         if mcp:
             available_servers = config_info.get('available_mcp_servers', [])
             active_servers = config_info.get('active_mcp_servers', [])
-            click.echo(f"🔌 MCP Servers: {len(active_servers)}/{len(available_servers)} active")
+            lines.append(f"🔌 MCP Servers: {len(active_servers)}/{len(available_servers)} active")
             if available_servers:
-                click.echo(f"   Available: {', '.join(available_servers)}")
-            
-        click.echo("="*60)
-        click.echo("💬 Start chatting! Type 'quit', 'exit', or press Ctrl+C to stop.")
+                lines.append(f"   Available: {', '.join(available_servers)}")
         
+        lines.append(_CHAT_READY.format_map(tag))
         if mcp:
-            click.echo("💡 MCP Commands: 'activate server_name', 'deactivate server_name', 'mcp status'")
+            lines.append(_MCP_COMMANDS_HINT.format_map(tag))
+        lines.append("=" * 60)
+        print("\n".join(lines))
         
-        click.echo("="*60)
+        # Interactive chat loop; PromptSession gives line editing, in-memory
+        # history and bracketed paste so large pastes arrive as one input.
+        # Input is read on asyncio; turns go through the sync chat() so they
+        # use the pooled HTTP/2 client shared by every agent.
+        import asyncio
+        from prompt_toolkit import PromptSession
+        session = PromptSession(enable_history_search=True)
+        you_prompt = f"{tag['you']} "
         
-        # Interactive chat loop
-        while True:
-            try:
-                user_input = input("\n🗣️  You: ").strip()
+        async def _arepl():
+            while True:
+                try:
+                    print()
+                    user_input = (await session.prompt_async(you_prompt)).strip()
+                    lowered = user_input.lower()
                 
-                if user_input.lower() in ['quit', 'exit', 'bye']:
-                    click.echo("👋 Goodbye!")
-                    break
+                    if lowered in _QUIT_COMMANDS:
+                        print("👋 Goodbye!")
+                        break
                 
-                # Handle MCP commands if using MCP agent
-                if mcp and hasattr(agent, 'activate_mcp_server'):
-                    if user_input.startswith('activate '):
-                        server_name = user_input[9:].strip()
-                        click.echo(f"🔌 Activating {server_name} MCP server...")
-                        success = agent.activate_mcp_server(server_name)
-                        if success:
-                            click.echo(f"✅ {server_name} server activated!")
-                        else:
-                            click.echo(f"❌ Failed to activate {server_name}")
-                        continue
+                    # Handle MCP commands if using MCP agent
+                    if mcp and hasattr(agent, 'activate_mcp_server'):
+                        if lowered.startswith('activate '):
+                            server_name = user_input[9:].strip()
+                            print(f"🔌 Activating {server_name} MCP server...")
+                            success = agent.activate_mcp_server(server_name)
+                            if success:
+                                print(f"✅ {server_name} server activated!")
+                            else:
+                                print(f"❌ Failed to activate {server_name}")
+                            continue
                     
-                    elif user_input.startswith('deactivate '):
-                        server_name = user_input[11:].strip()
-                        click.echo(f"🔌 Deactivating {server_name} MCP server...")
-                        success = agent.deactivate_mcp_server(server_name)
-                        if success:
-                            click.echo(f"✅ {server_name} server deactivated!")
-                        else:
-                            click.echo(f"❌ Failed to deactivate {server_name}")
-                        continue
+                        elif lowered.startswith('deactivate '):
+                            server_name = user_input[11:].strip()
+                            print(f"🔌 Deactivating {server_name} MCP server...")
+                            success = agent.deactivate_mcp_server(server_name)
+                            if success:
+                                print(f"✅ {server_name} server deactivated!")
+                            else:
+                                print(f"❌ Failed to deactivate {server_name}")
+                            continue
                     
-                    elif user_input.lower() == 'mcp status':
-                        config_info = agent.get_config()
-                        click.echo(f"\n📊 **MCP Status:**")
-                        click.echo(f"   Total tools: {config_info['total_tools']}")
-                        click.echo(f"   Active servers: {config_info['active_mcp_servers']}")
-                        click.echo(f"   Available servers: {config_info['available_mcp_servers']}")
-                        continue
+                        elif lowered == 'mcp status':
+                            config_info = agent.get_config()
+                            print(f"\n📊 **MCP Status:**")
+                            print(f"   Total tools: {config_info['total_tools']}")
+                            print(f"   Active servers: {config_info['active_mcp_servers']}")
+                            print(f"   Available servers: {config_info['available_mcp_servers']}")
+                            continue
                     
-                    elif user_input.lower() == 'mcp servers':
-                        agent.demonstrate_mcp_capabilities()
-                        continue
+                        elif lowered == 'mcp servers':
+                            agent.demonstrate_mcp_capabilities()
+                            continue
                 
-                if user_input:
-                    click.echo("\n🤖 Assistant:")
-                    agent.chat(user_input)
+                    if user_input:
+                        print(f"\n{tag['assistant']}")
+                        agent.chat(user_input)
                     
-            except KeyboardInterrupt:
-                click.echo("\n👋 Goodbye!")
-                break
-            except Exception as e:
-                click.echo(f"❌ Error: {e}")
+                except (KeyboardInterrupt, EOFError):
+                    print("\n👋 Goodbye!")
+                    break
+                except Exception as e:
+                    print(f"❌ Error: {e}")
+        
+        try:
+            asyncio.run(_arepl())
+        except KeyboardInterrupt:
+            print("\n👋 Goodbye!")
                 
     except ImportError as e:
-        click.echo(f"❌ Import error: {e}")
-        click.echo("💡 Make sure all dependencies are installed: pip install -r requirements.txt")
+        print(f"❌ Import error: {e}")
+        print("💡 Make sure all dependencies are installed: pip install -r requirements.txt")
     except Exception as e:
-        click.echo(f"❌ Initialization error: {e}")
-        click.echo("💡 Check your .env file and API key configuration")
+        print(f"❌ Initialization error: {e}")
+        print("💡 Check your .env file and API key configuration")
 
-@cli.command()
 def setup():
     """Set up environment configuration"""
     try:
         from .setup_env import setup_environment
         setup_environment()
     except ImportError:
-        click.echo("❌ Setup module not found")
+        print("❌ Setup module not found")
     except Exception as e:
-        click.echo(f"❌ Setup error: {e}")
-
-@cli.command()
-@click.option('--enhanced', is_flag=True, default=True, help='Test enhanced filesystem tools')
-@click.option('--mcp', is_flag=True, help='Test MCP integration')
-@click.option('--project', is_flag=True, help='Test project-aware mode')
-def test(enhanced, mcp, project):
-    """Test tools and functionality"""
-    click.echo("🧪 Running tool tests...")
+        print(f"❌ Setup error: {e}")
+
+# Third-party packages the agents import, checked by `test --dry-run`
+_AGENT_DEPENDENCIES = ('langchain', 'langchain_openai', 'composio_langchain', 'httpx', 'dotenv')
+
+def _dry_run():
+    """Check that agent modules and their dependencies can be found, without importing them"""
+    from importlib.util import find_spec
+    
+    ok = True
+    lines = ["🧪 Checking modules (dry run)..."]
+    for _, module_name, _ in _ALL_AGENTS:
+        found = find_spec(module_name) is not None
+        lines.append(f"   {'✅' if found else '⚪'} {module_name}{'' if found else ' (not available)'}")
+    for module_name in _AGENT_DEPENDENCIES:
+        found = find_spec(module_name) is not None
+        ok = ok and found
+        lines.append(f"   {'✅' if found else '❌'} {module_name}")
+    print("\n".join(lines))
+    return 0 if ok else 1
+
+def test(enhanced, mcp, project, dry_run):
+    """Test tools and functionality; returns the exit status"""
+    if dry_run:
+        return _dry_run()
+    
+    print("🧪 Running tool tests...")
     
     if project:
-        click.echo("🎯 Testing project-aware mode...")
+        print("🎯 Testing project-aware mode...")
         try:
             from .project_agent import ProjectAwareGrokAgent
             agent = ProjectAwareGrokAgent()
-            click.echo("✅ Project agent initialized successfully")
+            print("✅ Project agent initialized successfully")
             project_info = agent.get_project_info()
-            click.echo(f"📁 Project: {project_info['project_name']}")
-            click.echo(f"🔍 Languages: {', '.join(project_info['languages'])}")
-            click.echo(f"📊 Files: {project_info['file_count']} files")
+            print(f"📁 Project: {project_info['project_name']}")
+            print(f"🔍 Languages: {', '.join(project_info['languages'])}")
+            print(f"📊 Files: {project_info['file_count']} files")
         except Exception as e:
-            click.echo(f"❌ Project test error: {e}")
+            print(f"❌ Project test error: {e}")
+            return 1
     elif mcp:
-        click.echo("🔌 Testing MCP integration...")
-        os.system("python test_mcp_integration.py")
+        print("🔌 Testing MCP integration...")
+        return _run_script("test_mcp_integration.py")
     elif enhanced:
-        click.echo("✨ Testing enhanced filesystem tools...")
-        os.system("python test_enhanced_filesystem.py")
+        print("✨ Testing enhanced filesystem tools...")
+        return _run_script("test_enhanced_filesystem.py")
     else:
-        click.echo("🔧 Testing basic tools...")
+        print("🔧 Testing basic tools...")
         try:
             from .agent import GrokAgent
             agent = GrokAgent()
             agent.list_available_tools()
         except Exception as e:
-            click.echo(f"❌ Test error: {e}")
+            print(f"❌ Test error: {e}")
+            return 1
+    return 0
 
-@cli.group()
-def mcp():
-    """MCP (Model Context Protocol) server management"""
-    pass
-
-@mcp.command()
 def servers():
     """List all available MCP servers"""
     try:
         from .mcp_integration import MCPServerManager
         manager = MCPServerManager()
         
-        click.echo("🔌 **Available MCP Servers**")
-        click.echo("=" * 50)
+        print("🔌 **Available MCP Servers**")
+        print("=" * 50)
         
         servers = manager.list_available_servers()
         for server_name, server_info in servers.items():
-            click.echo(f"\n📡 **{server_info['name']}**")
-            click.echo(f"   {server_info['description']}")
-            click.echo(f"   Tools: {len(server_info['tools'])}")
+            print(f"\n📡 **{server_info['name']}**")
+            print(f"   {server_info['description']}")
+            print(f"   Tools: {len(server_info['tools'])}")
             
     except ImportError as e:
-        click.echo(f"❌ Import error: {e}")
+        print(f"❌ Import error: {e}")
     except Exception as e:
-        click.echo(f"❌ Error: {e}")
+        print(f"❌ Error: {e}")
 
-@mcp.command()
-@click.argument('server_name')
 def info(server_name):
     """Get detailed information about a specific MCP server"""
     try:
@@ -330,90 +483,209 @@ def info(server_name):
         
         server_info = manager.get_server_info(server_name)
         if server_info:
-            click.echo(f"📡 **{server_info['name']}**")
-            click.echo(f"Description: {server_info['description']}")
-            click.echo(f"Tools ({len(server_info['tools'])}):")
+            print(f"📡 **{server_info['name']}**")
+            print(f"Description: {server_info['description']}")
+            print(f"Tools ({len(server_info['tools'])}):")
             for tool in server_info['tools']:
-                click.echo(f"  • {tool}")
+                print(f"  • {tool}")
         else:
-            click.echo(f"❌ Server '{server_name}' not found")
+            print(f"❌ Server '{server_name}' not found")
             
     except ImportError as e:
-        click.echo(f"❌ Import error: {e}")
+        print(f"❌ Import error: {e}")
     except Exception as e:
-        click.echo(f"❌ Error: {e}")
+        print(f"❌ Error: {e}")
 
-@mcp.command()
 def demo():
     """Run interactive MCP demo"""
-    click.echo("🎮 Starting MCP Interactive Demo...")
-    os.system("python test_mcp_integration.py interactive")
+    print("🎮 Starting MCP Interactive Demo...")
+    return _run_script("test_mcp_integration.py", "interactive")
+
+def _print_tool_summary():
+    """Summarise each agent's tools from class metadata without building any agent"""
+    lines = ["🛠️  **Agent Tool Summary**", "=" * 50]
+    for agent_type, module_name, class_name in _ALL_AGENTS:
+        try:
+            cls = _agent_class(module_name, class_name)
+        except ImportError:
+            lines.append(f"\n📦 {agent_type}: not available")
+            continue
+        apps = getattr(cls, 'DEFAULT_COMPOSIO_APPS', ())
+        lines.append(f"\n📦 {agent_type} ({class_name})")
+        lines.append(f"   Composio apps: {', '.join(apps) if apps else 'None'}")
+        lines.append(f"   Custom tools: {getattr(cls, 'CUSTOM_TOOL_COUNT', 0)}")
+    print("\n".join(lines))
 
-@cli.command()
-def tools():
+def tools(brief):
     """List all available tools"""
+    if brief:
+        _print_tool_summary()
+        return
+    
     try:
         # Try to load the most advanced agent available
-        agent = None
-        agent_type = "Unknown"
-        
-        try:
-            from .mcp_enhanced_agent import MCPEnhancedGrokAgent
-            agent = MCPEnhancedGrokAgent()
-            agent_type = "MCP-Enhanced"
-        except:
+        for agent_type, module_name, class_name in _AGENTS[:-1]:
             try:
-                from .enhanced_agent import EnhancedGrokAgent
-                agent = EnhancedGrokAgent()
-                agent_type = "Enhanced"
-            except:
-                from .agent import GrokAgent
-                agent = GrokAgent()
-                agent_type = "Standard"
+                agent = _default_agent(module_name, class_name)
+                break
+            except Exception:
+                continue
+        else:
+            # The standard agent is the last resort; let its errors surface
+            agent_type, module_name, class_name = _AGENTS[-1]
+            agent = _default_agent(module_name, class_name)
         
-        click.echo(f"🛠️  **{agent_type} Agent Tools**")
-        click.echo("=" * 50)
+        print(f"🛠️  **{agent_type} Agent Tools**")
+        print("=" * 50)
         agent.list_available_tools()
         
     except Exception as e:
-        click.echo(f"❌ Error listing tools: {e}")
+        print(f"❌ Error listing tools: {e}")
 
-@cli.command()
 def config():
     """Show current configuration"""
     try:
-        # Load environment variables
-        from dotenv import load_dotenv
-        load_dotenv()
+        print("⚙️  **Current Configuration**")
+        print("=" * 40)
         
-        click.echo("⚙️  **Current Configuration**")
-        click.echo("=" * 40)
-        
-        config_vars = [
-            ('GROK_API_KEY', 'API Key'),
-            ('GROK_MODEL', 'Model'),
-            ('GROK_BASE_URL', 'Base URL'),
-            ('GROK_TEMPERATURE', 'Temperature'),
-            ('GROK_MAX_TOKENS', 'Max Tokens'),
-            ('GROK_VERBOSE', 'Verbose Mode')
-        ]
-        
-        for var, label in config_vars:
-            value = os.getenv(var, 'Not set')
-            if var == 'GROK_API_KEY' and value != 'Not set':
+        try:
+            cfg = env_config()
+        except ValueError as e:
+            # Fall back to the raw strings so every variable is still listed
+            print(f"⚠️  Invalid setting: {e}")
+            cfg = None
+        for f in fields(GrokEnvConfig):
+            value = getattr(cfg, f.name) if cfg else os.environ.get(f.metadata['env'], f.default)
+            if value is None:
+                value = 'Not set'
+            elif f.name == 'api_key':
                 value = f"{value[:8]}..." + "*" * 10  # Mask API key
-            click.echo(f"{label:15}: {value}")
+            print(f"{f.metadata['label']:15}: {value}")
             
         # Check .env file
         env_exists = os.path.exists('.env')
-        click.echo(f"{''.ljust(15)}: {'Found' if env_exists else 'Not found'}")
+        print(f"{''.ljust(15)}: {'Found' if env_exists else 'Not found'}")
         
     except Exception as e:
-        click.echo(f"❌ Error loading configuration: {e}")
+        print(f"❌ Error loading configuration: {e}")
+
+def _existing_path(value):
+    """argparse type for paths that must already exist"""
+    if not Path(value).exists():
+        raise argparse.ArgumentTypeError(f"Path '{value}' does not exist.")
+    return value
+
+def _existing_file(value):
+    """argparse type for files that must already exist"""
+    if not Path(value).is_file():
+        raise argparse.ArgumentTypeError(f"File '{value}' does not exist.")
+    return value
+
+def _positive_int(value):
+    """argparse type for integers of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not an integer.")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}.")
+    return number
+
+def build_parser():
+    """Build the argument parser for all Grok CLI commands"""
+    from . import __version__
+    
+    parser = argparse.ArgumentParser(
+        prog='grok_cli',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description="""🚀 Grok CLI - AI Assistant with Enhanced Capabilities
+
+A powerful command-line AI assistant that combines:
+• Composio file and shell tools
+• Enhanced filesystem operations
+• MCP (Model Context Protocol) server integration
+• Direct filesystem access
+• Project-aware development
+• Git integration and merge conflict resolution
+• Context-aware coding assistance""",
+    )
+    parser.add_argument('--version', action='version', version=f'%(prog)s, version {__version__}')
+    parser.add_argument('--no-emoji', action='store_true', help='Print ASCII stand-ins instead of emoji (automatic when stdout is not UTF-8)')
+    # Also accepted after any subcommand; SUPPRESS keeps a subcommand's
+    # default from overwriting a --no-emoji given before it
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--no-emoji', action='store_true', default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+    sub = parser.add_subparsers(dest='command', metavar='COMMAND')
+    
+    p = sub.add_parser('dev', parents=[common], help='Start project-aware development mode (like Claude Code)')
+    p.add_argument('--project-path', type=_existing_path, help='Path to project directory (defaults to current)')
+    p.add_argument('--config', help='Path to .env configuration file')
+    p.add_argument('--temperature', type=float, help='Model temperature (0.0-2.0)')
+    p.add_argument('--max-tokens', type=int, help='Maximum tokens in response')
+    p.add_argument('--verbose', action='store_true', help='Enable verbose mode')
+    p.set_defaults(func=dev)
+    
+    p = sub.add_parser('chat', parents=[common], help='Start interactive chat with the AI assistant')
+    p.add_argument('--config', help='Path to .env configuration file')
+    p.add_argument('--temperature', type=float, help='Model temperature (0.0-2.0)')
+    p.add_argument('--max-tokens', type=int, help='Maximum tokens in response')
+    p.add_argument('--verbose', action='store_true', help='Enable verbose mode')
+    p.add_argument('--enhanced', action='store_true', default=True, help='Use enhanced agent with filesystem tools (default)')
+    p.add_argument('--no-enhanced', dest='enhanced', action='store_false', help='Use the standard agent')
+    p.add_argument('--mcp', action='store_true', help='Use MCP-enhanced agent')
+    p.add_argument('--trace', action='store_true', help='Enable LangChain tracing and callbacks (standard agent: --no-enhanced or --batch)')
+    p.add_argument('--memory-window', type=int, help='Number of recent exchanges kept in chat memory (standard agent: --no-enhanced or --batch)')
+    p.add_argument('--batch', type=_existing_file, help='Run each non-empty line of a file as a prompt, concurrently (standard agent)')
+    p.add_argument('--concurrency', type=_positive_int, default=5, help='Maximum concurrent prompts in --batch mode (default: 5)')
+    p.set_defaults(func=chat)
+    
+    p = sub.add_parser('setup', parents=[common], help='Set up environment configuration')
+    p.set_defaults(func=setup)
+    
+    p = sub.add_parser('test', parents=[common], help='Test tools and functionality')
+    p.add_argument('--enhanced', action='store_true', default=True, help='Test enhanced filesystem tools')
+    p.add_argument('--mcp', action='store_true', help='Test MCP integration')
+    p.add_argument('--project', action='store_true', help='Test project-aware mode')
+    p.add_argument('--dry-run', action='store_true', help='Only check that modules can be found; no agents, no network')
+    p.set_defaults(func=test)
+    
+    mcp_parser = sub.add_parser('mcp', parents=[common], help='MCP (Model Context Protocol) server management')
+    mcp_sub = mcp_parser.add_subparsers(dest='mcp_command', metavar='COMMAND')
+    p = mcp_sub.add_parser('servers', parents=[common], help='List all available MCP servers')
+    p.set_defaults(func=servers)
+    p = mcp_sub.add_parser('info', parents=[common], help='Get detailed information about a specific MCP server')
+    p.add_argument('server_name')
+    p.set_defaults(func=info)
+    p = mcp_sub.add_parser('demo', parents=[common], help='Run interactive MCP demo')
+    p.set_defaults(func=demo)
+    mcp_parser.set_defaults(func=None, parser=mcp_parser)
+    
+    p = sub.add_parser('tools', parents=[common], help='List all available tools')
+    p.add_argument('--brief', action='store_true', help='Summarise tools from agent metadata without initializing any agent')
+    p.set_defaults(func=tools)
+    
+    p = sub.add_parser('config', parents=[common], help='Show current configuration')
+    p.set_defaults(func=config)
+    
+    parser.set_defaults(func=None, parser=parser)
+    return parser
 
-def main():
-    """Main entry point"""
-    cli()
+def main(argv=None):
+    """Main entry point; returns the command's exit status"""
+    argv = sys.argv[1:] if argv is None else argv
+    # Before parsing, so --help is readable on non-UTF-8 terminals too
+    if '--no-emoji' in argv or not _stdout_is_utf8():
+        _disable_emoji()
+    args = vars(build_parser().parse_args(argv))
+    func = args.pop('func')
+    parser = args.pop('parser')
+    if func is None:
+        parser.print_help()
+        return 0
+    args.pop('command', None)
+    args.pop('mcp_command', None)
+    args.pop('no_emoji', None)
+    return func(**args)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -3,28 +3,269 @@ Project-Aware Grok Agent for Local Development
 Works directly on host filesystem like Claude Code
 """
 
-from langchain.agents import create_openai_functions_agent, AgentExecutor
-from langchain import hub
-from langchain_openai import ChatOpenAI
-from langchain.memory import ConversationBufferMemory
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from composio_langchain import ComposioToolSet, App, WorkspaceType
 import os
-from dotenv import load_dotenv
+import re
+import shlex
+from functools import cache, lru_cache
 from pathlib import Path
 
-# Load environment variables from .env file
-load_dotenv()
+from ._env import env_config
+from .agent import _error_message, _http_client
+
+# LangChain/Composio are imported on first agent construction, as in agent.py
+_IMPORTED = False
+
+def _lazy_imports():
+    """Bind the heavy LangChain/Composio names into module globals once"""
+    global _IMPORTED, create_openai_functions_agent, AgentExecutor, ChatOpenAI
+    global ConversationBufferWindowMemory, ChatPromptTemplate, MessagesPlaceholder
+    global ComposioToolSet, Action, App, WorkspaceType, SystemMessage, HumanMessage, StdoutTokens
+    if _IMPORTED:
+        return
+    from langchain.agents import create_openai_functions_agent, AgentExecutor
+    from langchain_openai import ChatOpenAI
+    from langchain.memory import ConversationBufferWindowMemory
+    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+    from langchain_core.messages import SystemMessage, HumanMessage
+    from composio_langchain import ComposioToolSet, Action, App, WorkspaceType
+    from .streaming import StdoutTokens
+    _IMPORTED = True
+
+@cache
+def _host_toolset(project_path):
+    """Host-workspace ComposioToolSet rooted at `project_path`, shared by agents on that project
+    
+    Each project gets its own workspace, whose file manager and shell are
+    pointed at the project root once here, so tools never depend on the
+    process working directory and agents for different projects can run
+    side by side.
+    """
+    toolset = ComposioToolSet(workspace_config=WorkspaceType.Host())
+    toolset.execute_action(Action.FILETOOL_CHANGE_WORKING_DIRECTORY, {"path": project_path})
+    toolset.execute_action(Action.SHELLTOOL_EXEC_COMMAND, {"cmd": f"cd {shlex.quote(project_path)}"})
+    return toolset
+
+@lru_cache(maxsize=32)
+def _get_host_tools(project_path, app_names):
+    """Fetch a project's Host-workspace Composio tools once per tuple of App names"""
+    return tuple(_host_toolset(project_path).get_tools(apps=[getattr(App, name) for name in app_names]))
+
+# Common file extensions and their languages
+_LANGUAGE_BY_SUFFIX = {
+    '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript', 
+    '.jsx': 'React', '.tsx': 'React TypeScript', '.vue': 'Vue.js',
+    '.java': 'Java', '.cpp': 'C++', '.c': 'C', '.cs': 'C#',
+    '.go': 'Go', '.rs': 'Rust', '.php': 'PHP', '.rb': 'Ruby',
+    '.html': 'HTML', '.css': 'CSS', '.scss': 'SASS', '.less': 'LESS',
+    '.json': 'JSON', '.yaml': 'YAML', '.yml': 'YAML', '.xml': 'XML',
+    '.md': 'Markdown', '.txt': 'Text', '.sh': 'Shell Script'
+}
+
+# Framework detection by exact (case-insensitive) file name
+_FRAMEWORK_PATTERNS = {
+    'package.json': ['Node.js/npm'],
+    'requirements.txt': ['Python'],
+    'Pipfile': ['Python/Pipenv'],
+    'poetry.lock': ['Python/Poetry'],
+    'Cargo.toml': ['Rust'],
+    'go.mod': ['Go'],
+    'pom.xml': ['Java/Maven'],
+    'build.gradle': ['Java/Gradle'],
+    'composer.json': ['PHP/Composer'],
+    'Gemfile': ['Ruby/Bundler'],
+    'yarn.lock': ['Node.js/Yarn'],
+    'next.config.js': ['Next.js'],
+    'nuxt.config.js': ['Nuxt.js'],
+    'vue.config.js': ['Vue.js'],
+    'angular.json': ['Angular'],
+    'svelte.config.js': ['Svelte'],
+    'tailwind.config.js': ['Tailwind CSS'],
+    'webpack.config.js': ['Webpack'],
+    'vite.config.js': ['Vite'],
+    'tsconfig.json': ['TypeScript'],
+    'dockerfile': ['Docker'],
+    'docker-compose.yml': ['Docker Compose'],
+    '.gitignore': ['Git'],
+    'README.md': ['Documentation']
+}
+_FRAMEWORKS_BY_NAME = {name.lower(): frameworks for name, frameworks in _FRAMEWORK_PATTERNS.items()}
+
+# Dependency, build and cache directories that never describe the project itself
+_SKIP_DIRS = frozenset({
+    'node_modules', 'venv', '__pycache__', 'dist', 'build', 'target',
+})
+
+# Project analysis looks at no more than this many files
+_MAX_SCANNED_FILES = 100
+
+def _iter_project_files(root, limit):
+    """Yield the names of up to `limit` non-hidden files under `root`
+    
+    Hidden entries and _SKIP_DIRS are pruned before descending, and the walk
+    stops once `limit` files have been yielded.
+    """
+    stack = [root]
+    count = 0
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue  # unreadable directory
+        with entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.name
+                    count += 1
+                    if count >= limit:
+                        return
+
+@lru_cache(maxsize=256)
+def _classify(name):
+    """(language, frameworks) for a lower-cased file name; names like __init__.py repeat across a tree"""
+    return _LANGUAGE_BY_SUFFIX.get(os.path.splitext(name)[1]), _FRAMEWORKS_BY_NAME.get(name, ())
+
+@lru_cache(maxsize=8)
+def _scan_project(root, mtime_ns):
+    """Scan a project tree once per (root, root mtime) for file count, languages and frameworks"""
+    names = [name.lower() for name in _iter_project_files(root, _MAX_SCANNED_FILES)]
+    
+    # Classify in one pass over the collected names
+    languages = set()
+    frameworks = set()
+    for language, name_frameworks in map(_classify, names):
+        if language:
+            languages.add(language)
+        if name_frameworks:
+            frameworks.update(name_frameworks)
+    return len(names), frozenset(languages), frozenset(frameworks)
+
+@lru_cache(maxsize=8)
+def _system_prompt(project_name, project_path, is_git_repo, languages, frameworks, file_count):
+    """Build the project-aware system prompt once per distinct project context"""
+    return f"""You are an expert software development assistant working directly on the user's local filesystem, similar to Claude Code or GitHub Copilot. 
+
+**CURRENT PROJECT CONTEXT:**
+- Project: {project_name}
+- Path: {project_path}
+- Git Repository: {'Yes' if is_git_repo else 'No'}
+- Languages: {', '.join(languages) or 'Unknown'}
+- Frameworks: {', '.join(frameworks) or 'None detected'}
+- Files Found: {file_count} files
+
+**YOUR CAPABILITIES:**
+You have direct access to the host filesystem through these tools:
+- **File Operations**: Read, write, edit, create, delete files and directories
+- **Shell Commands**: Execute terminal commands (npm install, git commands, build scripts, etc.)
+- **Git Operations**: Full version control capabilities (status, commit, push, pull, merge, etc.)
+
+**DEVELOPMENT WORKFLOW ASSISTANCE:**
+- **Code Analysis**: Read and understand existing codebase structure
+- **Merge Conflict Resolution**: Detect conflicts via git status, read conflicted files, resolve conflicts by editing files
+- **Project Setup**: Install dependencies, run build scripts, start dev servers
+- **Testing**: Run test suites, lint code, format code
+- **Debugging**: Analyze logs, check file contents, run diagnostic commands
+- **Refactoring**: Modify multiple files safely with proper backup practices
+
+**WORKING PRINCIPLES:**
+1. **Project Awareness**: Always consider the project context and existing patterns
+2. **Safety First**: Use git status before major changes, create branches for risky operations
+3. **Explain Actions**: Describe what you're doing before executing commands
+4. **Iterative Development**: Break complex tasks into smaller, verifiable steps
+5. **Follow Conventions**: Respect existing code style, naming patterns, and project structure
+
+**MERGE CONFLICT RESOLUTION WORKFLOW:**
+1. Run `git status` to identify conflicted files
+2. Read conflicted files to understand the conflicts
+3. Analyze both sides of conflicts (HEAD vs incoming changes)
+4. Edit files to resolve conflicts (remove conflict markers, choose appropriate code)
+5. Test the resolution if possible
+6. Add resolved files with `git add`
+7. Complete the merge with `git commit`
+
+**COMMON COMMANDS FOR PROJECT WORK:**
+- `git status` - Check repository state
+- `git log --oneline -10` - Recent commits
+- `npm install` / `pip install -r requirements.txt` - Install dependencies
+- `npm test` / `pytest` / `cargo test` - Run tests
+- `npm run build` / `python setup.py build` - Build project
+- `npm start` / `python app.py` - Start development server
+
+Always work within the current project directory: {project_path}
+"""
+
+@lru_cache(maxsize=8)
+def _project_prompt(system_prompt):
+    """Compile the agent prompt once per system prompt"""
+    return ChatPromptTemplate.from_messages([
+        ("system", system_prompt),
+        MessagesPlaceholder(variable_name="chat_history"),
+        ("user", "{input}"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ])
+
+# Only clearly conversational messages (greetings, thanks, acknowledgements)
+# are answered by the LLM directly; everything else, including questions
+# about the project, goes through the AgentExecutor so the model can look
+# at the code.
+_CONVERSATIONAL_RE = re.compile(
+    r"(?:hi|hello|hey|yo|thanks|thank you|thx|ty|cheers|ok(?:ay)?|cool|great|nice|"
+    r"got it|sounds good|good (?:morning|afternoon|evening|night)|bye|goodbye|yes|no|sure)"
+    r"(?:\s+(?:there|again|so much|a lot|very much|grok))?[\s!.,:)]*",
+    re.I,
+)
+
+def _needs_tools(message):
+    """Whether `message` should go through the AgentExecutor rather than a direct LLM reply"""
+    return not _CONVERSATIONAL_RE.fullmatch(message.strip())
+
+# Per-app hints for narrowing the tools sent with a request. Multi-step work
+# (fixing, merging, refactoring) usually needs both files and the shell, so
+# it matches every group. Alternations are closed with \b so words like
+# "logic" or "runtime" don't match, and a file name needs a known extension.
+_MULTI_STEP_HINTS = (
+    r"fix(?:es|ed|ing)?|debug(?:ging)?|refactor(?:ing)?|resolve|merg(?:e|ing)|"
+    r"conflicts?|implement(?:ing)?"
+)
+_FILE_NAME_HINT = r"\b[\w-]+\.(?:" + "|".join(
+    sorted({suffix[1:] for suffix in _LANGUAGE_BY_SUFFIX} | {"toml", "cfg", "ini", "lock", "env", "log"})
+) + r")\b"
+_TOOL_GROUP_HINTS = {
+    "FILETOOL": re.compile(
+        r"[`/\\]|" + _FILE_NAME_HINT + r"|\b(?:" + _MULTI_STEP_HINTS + r"|read|write|edit|create|delete|"
+        r"remove|rename|move|copy|files?|dir(?:ectory|ectories|s)?|folders?|open|show|find|search|look|code)\b",
+        re.I,
+    ),
+    "SHELLTOOL": re.compile(
+        r"\b(?:" + _MULTI_STEP_HINTS + r"|run(?:s|ning)?|exec(?:ute)?|install|build|tests?|lint|format|git|"
+        r"commits?|branch(?:es)?|diff|status|logs?|npm|pip|pytest|cargo|make|commands?|terminal|shell|grep|list)\b",
+        re.I,
+    ),
+}
 
 class ProjectAwareGrokAgent:
-    def __init__(self, project_path=None, api_key=None, model=None, base_url=None, temperature=None, max_tokens=None, verbose=None):
+    DEFAULT_COMPOSIO_APPS = (
+        "FILETOOL",    # File operations (read, write, create, delete)
+        "SHELLTOOL",   # Shell/terminal commands
+    )
+    CUSTOM_TOOL_COUNT = 0
+    
+    def __init__(self, project_path=None, api_key=None, model=None, base_url=None, temperature=None, max_tokens=None, verbose=None, memory_window=None):
         # Load from .env file if parameters not provided
-        self.api_key = api_key or os.getenv("GROK_API_KEY")
-        self.model = model or os.getenv("GROK_MODEL", "grok-4-0709")
-        self.base_url = base_url or os.getenv("GROK_BASE_URL", "https://api.x.ai/v1")
-        self.temperature = float(temperature or os.getenv("GROK_TEMPERATURE", "0.7"))
-        self.max_tokens = int(max_tokens or os.getenv("GROK_MAX_TOKENS", "1000"))
-        self.verbose = verbose if verbose is not None else os.getenv("GROK_VERBOSE", "False").lower() == "true"
+        cfg = env_config()
+        _lazy_imports()
+        
+        self.api_key = api_key or cfg.api_key
+        self.model = model or cfg.model
+        self.base_url = base_url or cfg.base_url
+        self.temperature = float(temperature if temperature is not None else cfg.temperature)
+        self.max_tokens = int(max_tokens if max_tokens is not None else cfg.max_tokens)
+        self.verbose = verbose if verbose is not None else cfg.verbose
+        self.memory_window = memory_window if memory_window is not None else cfg.memory_window
         
         if not self.api_key:
             raise ValueError("GROK_API_KEY must be provided either as parameter or in .env file")
@@ -33,27 +274,23 @@ class ProjectAwareGrokAgent:
         self.project_path = Path(project_path or os.getcwd()).resolve()
         print(f"🎯 Project path: {self.project_path}")
         
-        # Change to project directory
-        os.chdir(self.project_path)
-        
         self.llm = ChatOpenAI(
             api_key=self.api_key,
             model=self.model,
             base_url=self.base_url,
             temperature=self.temperature,
-            max_tokens=self.max_tokens
+            max_tokens=self.max_tokens,
+            streaming=True,
+            # Reuse pooled keep-alive connections across chat turns
+            http_client=_http_client()
         )
         
-        # Configure ComposioToolSet with explicit Host workspace for direct filesystem access
-        self.composio_toolset = ComposioToolSet(
-            workspace_config=WorkspaceType.Host()
-        )
+        # ComposioToolSet with a Host workspace rooted at the project
+        self.composio_toolset = _host_toolset(str(self.project_path))
         
-        # Get comprehensive tools for project development
-        self.tools = self.composio_toolset.get_tools(apps=[
-            App.FILETOOL,      # File operations (read, write, create, delete)
-            App.SHELLTOOL,     # Shell/terminal commands
-        ])
+        # Get comprehensive tools for project development; copy the cached
+        # tuple so per-instance changes don't leak into the cache
+        self.tools = list(_get_host_tools(str(self.project_path), self.DEFAULT_COMPOSIO_APPS))
         
         # Add local Git operations via shell instead of GitHub API
         # This avoids authentication issues and works with local repos
@@ -61,102 +298,71 @@ class ProjectAwareGrokAgent:
         # Analyze project structure for context
         self.project_context = self._analyze_project_structure()
         
-        # Create project-aware system prompt
-        system_prompt = self._create_system_prompt()
+        # Create project-aware system prompt; both are shared by agents on
+        # the same, unchanged project
+        self.system_prompt = self._create_system_prompt()
+        self.prompt = _project_prompt(self.system_prompt)
         
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            MessagesPlaceholder(variable_name="chat_history"),
-            ("user", "{input}"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ])
-        
-        self.memory = ConversationBufferMemory(
+        # Keep only the last few exchanges so prompt size stays bounded per turn
+        self.memory = ConversationBufferWindowMemory(
             memory_key="chat_history",
-            return_messages=True
+            return_messages=True,
+            k=self.memory_window
         )
         
-        self.agent = create_openai_functions_agent(self.llm, self.tools, prompt)
-        self.agent_executor = AgentExecutor(
-            agent=self.agent,
-            tools=self.tools,
+        self.agent = create_openai_functions_agent(self.llm, self.tools, self.prompt)
+        self.agent_executor = self._new_executor(self.agent, self.tools)
+        
+        # Tools split by Composio app (the prefix of each tool name), with
+        # executors over a subset of the apps built on first use
+        self._tool_groups = {}
+        for tool in self.tools:
+            self._tool_groups.setdefault(tool.name.split("_", 1)[0], []).append(tool)
+        self._executors = {frozenset(self._tool_groups): self.agent_executor}
+    
+    def _new_executor(self, agent, tools):
+        """AgentExecutor sharing this agent's memory and settings"""
+        return AgentExecutor(
+            agent=agent,
+            tools=tools,
             memory=self.memory,
             verbose=self.verbose,  
             max_iterations=15  # Increased for complex project operations
         )
     
+    def _executor_for(self, user_message):
+        """Executor whose tool set only covers the apps the message seems to need
+        
+        Fewer tool schemas are sent with every LLM call; when no group or
+        every group matches, the executor with all tools is used.
+        """
+        groups = frozenset(
+            name for name, pattern in _TOOL_GROUP_HINTS.items()
+            if name in self._tool_groups and pattern.search(user_message)
+        ) or frozenset(self._tool_groups)
+        executor = self._executors.get(groups)
+        if executor is None:
+            tools = [tool for name in groups for tool in self._tool_groups[name]]
+            agent = create_openai_functions_agent(self.llm, tools, self.prompt)
+            executor = self._executors[groups] = self._new_executor(agent, tools)
+        return executor
+    
     def _analyze_project_structure(self):
         """Analyze the project structure to understand the codebase"""
         context = {
             "project_path": str(self.project_path),
             "project_name": self.project_path.name,
             "is_git_repo": (self.project_path / ".git").exists(),
-            "files": [],
+            "file_count": 0,
             "languages": set(),
             "frameworks": set(),
         }
         
-        # Common file extensions and their languages
-        language_map = {
-            '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript', 
-            '.jsx': 'React', '.tsx': 'React TypeScript', '.vue': 'Vue.js',
-            '.java': 'Java', '.cpp': 'C++', '.c': 'C', '.cs': 'C#',
-            '.go': 'Go', '.rs': 'Rust', '.php': 'PHP', '.rb': 'Ruby',
-            '.html': 'HTML', '.css': 'CSS', '.scss': 'SASS', '.less': 'LESS',
-            '.json': 'JSON', '.yaml': 'YAML', '.yml': 'YAML', '.xml': 'XML',
-            '.md': 'Markdown', '.txt': 'Text', '.sh': 'Shell Script'
-        }
-        
-        # Framework detection patterns
-        framework_patterns = {
-            'package.json': ['Node.js/npm'],
-            'requirements.txt': ['Python'],
-            'Pipfile': ['Python/Pipenv'],
-            'poetry.lock': ['Python/Poetry'],
-            'Cargo.toml': ['Rust'],
-            'go.mod': ['Go'],
-            'pom.xml': ['Java/Maven'],
-            'build.gradle': ['Java/Gradle'],
-            'composer.json': ['PHP/Composer'],
-            'Gemfile': ['Ruby/Bundler'],
-            'yarn.lock': ['Node.js/Yarn'],
-            'next.config.js': ['Next.js'],
-            'nuxt.config.js': ['Nuxt.js'],
-            'vue.config.js': ['Vue.js'],
-            'angular.json': ['Angular'],
-            'svelte.config.js': ['Svelte'],
-            'tailwind.config.js': ['Tailwind CSS'],
-            'webpack.config.js': ['Webpack'],
-            'vite.config.js': ['Vite'],
-            'tsconfig.json': ['TypeScript'],
-            'dockerfile': ['Docker'],
-            'docker-compose.yml': ['Docker Compose'],
-            '.gitignore': ['Git'],
-            'README.md': ['Documentation']
-        }
-        
         try:
-            # Scan project files (limit to reasonable depth)
-            for item in self.project_path.rglob("*"):
-                if item.is_file() and not any(part.startswith('.') for part in item.parts):
-                    relative_path = item.relative_to(self.project_path)
-                    context["files"].append(str(relative_path))
-                    
-                    # Detect language
-                    suffix = item.suffix.lower()
-                    if suffix in language_map:
-                        context["languages"].add(language_map[suffix])
-                    
-                    # Detect frameworks
-                    filename = item.name.lower()
-                    for pattern, frameworks in framework_patterns.items():
-                        if pattern in filename:
-                            context["frameworks"].update(frameworks)
-                    
-                    # Limit file scanning to prevent overload
-                    if len(context["files"]) > 100:
-                        break
-            
+            root = str(self.project_path)
+            context["file_count"], languages, frameworks = _scan_project(root, os.stat(root).st_mtime_ns)
+            context["languages"].update(languages)
+            context["frameworks"].update(frameworks)
         except Exception as e:
             print(f"Warning: Could not fully analyze project structure: {e}")
         
@@ -165,81 +371,70 @@ class ProjectAwareGrokAgent:
     def _create_system_prompt(self):
         """Create a project-aware system prompt"""
         context = self.project_context
-        
-        prompt = f"""You are an expert software development assistant working directly on the user's local filesystem, similar to Claude Code or GitHub Copilot. 
-
-**CURRENT PROJECT CONTEXT:**
-- Project: {context['project_name']}
-- Path: {context['project_path']}
-- Git Repository: {'Yes' if context['is_git_repo'] else 'No'}
-- Languages: {', '.join(sorted(context['languages'])) if context['languages'] else 'Unknown'}
-- Frameworks: {', '.join(sorted(context['frameworks'])) if context['frameworks'] else 'None detected'}
-- Files Found: {len(context['files'])} files
-
-**YOUR CAPABILITIES:**
-You have direct access to the host filesystem through these tools:
-- **File Operations**: Read, write, edit, create, delete files and directories
-- **Shell Commands**: Execute terminal commands (npm install, git commands, build scripts, etc.)
-- **Git Operations**: Full version control capabilities (status, commit, push, pull, merge, etc.)
-
-**DEVELOPMENT WORKFLOW ASSISTANCE:**
-- **Code Analysis**: Read and understand existing codebase structure
-- **Merge Conflict Resolution**: Detect conflicts via git status, read conflicted files, resolve conflicts by editing files
-- **Project Setup**: Install dependencies, run build scripts, start dev servers
-- **Testing**: Run test suites, lint code, format code
-- **Debugging**: Analyze logs, check file contents, run diagnostic commands
-- **Refactoring**: Modify multiple files safely with proper backup practices
-
-**WORKING PRINCIPLES:**
-1. **Project Awareness**: Always consider the project context and existing patterns
-2. **Safety First**: Use git status before major changes, create branches for risky operations
-3. **Explain Actions**: Describe what you're doing before executing commands
-4. **Iterative Development**: Break complex tasks into smaller, verifiable steps
-5. **Follow Conventions**: Respect existing code style, naming patterns, and project structure
-
-**MERGE CONFLICT RESOLUTION WORKFLOW:**
-1. Run `git status` to identify conflicted files
-2. Read conflicted files to understand the conflicts
-3. Analyze both sides of conflicts (HEAD vs incoming changes)
-4. Edit files to resolve conflicts (remove conflict markers, choose appropriate code)
-5. Test the resolution if possible
-6. Add resolved files with `git add`
-7. Complete the merge with `git commit`
-
-**COMMON COMMANDS FOR PROJECT WORK:**
-- `git status` - Check repository state
-- `git log --oneline -10` - Recent commits
-- `npm install` / `pip install -r requirements.txt` - Install dependencies
-- `npm test` / `pytest` / `cargo test` - Run tests
-- `npm run build` / `python setup.py build` - Build project
-- `npm start` / `python app.py` - Start development server
-
-Always work within the current project directory: {context['project_path']}
-"""
-        return prompt
+        return _system_prompt(
+            context['project_name'],
+            context['project_path'],
+            context['is_git_repo'],
+            tuple(sorted(context['languages'])),
+            tuple(sorted(context['frameworks'])),
+            context['file_count'],
+        )
+    
+    def _toolless_messages(self, user_message):
+        """Messages for answering directly with the LLM, bypassing the AgentExecutor"""
+        history = self.memory.load_memory_variables({})["chat_history"]
+        return [
+            SystemMessage(content=self.system_prompt),
+            *history,
+            HumanMessage(content=user_message),
+        ]
+    
+    def _finish_reply(self, user_message, tokens, output, via_tools):
+        """End a streamed reply, recording direct LLM answers in memory"""
+        output = tokens.finish(output)
+        if not via_tools:
+            self.memory.save_context({"input": user_message}, {"output": output})
+        return output
     
     def chat(self, user_message):
         """Chat with the project-aware agent"""
+        # Tokens are printed by the callback as the LLM streams them, on both
+        # the tool-using and the direct path
+        tokens = StdoutTokens()
+        config = {"callbacks": [tokens]}
+        try:
+            via_tools = _needs_tools(user_message)
+            if via_tools:
+                output = self._executor_for(user_message).invoke({"input": user_message}, config=config).get("output")
+            else:
+                output = self.llm.invoke(self._toolless_messages(user_message), config=config).content
+            return self._finish_reply(user_message, tokens, output, via_tools)
+        except Exception as e:
+            error_msg = _error_message(e)
+            print(error_msg)
+            return error_msg
+    
+    async def achat(self, user_message):
+        """Async counterpart of chat() so several requests can overlap their LLM calls"""
+        tokens = StdoutTokens()
+        config = {"callbacks": [tokens]}
         try:
-            response = self.agent_executor.invoke({"input": user_message})
-            output = response.get("output", "Sorry, I couldn't generate a response.")
-            print(output)  
-            return output
+            via_tools = _needs_tools(user_message)
+            if via_tools:
+                output = (await self._executor_for(user_message).ainvoke({"input": user_message}, config=config)).get("output")
+            else:
+                output = (await self.llm.ainvoke(self._toolless_messages(user_message), config=config)).content
+            return self._finish_reply(user_message, tokens, output, via_tools)
         except Exception as e:
-            if "rate_limit" in str(e).lower() or "429" in str(e):
-                error_msg = "Rate limit exceeded. Please try again later."
-                print(error_msg)
-                return error_msg
-            error_msg = f"An error occurred: {str(e)}"
+            error_msg = _error_message(e)
             print(error_msg)
             return error_msg
     
     def list_available_tools(self):
         """List all available tools"""
-        print("🛠️  **Project Development Tools**")
-        print("=" * 50)
-        for tool in self.tools:
-            print(f"  • {tool.name}: {tool.description}")
+        lines = ["🛠️  **Project Development Tools**", "=" * 50]
+        lines.extend(f"  • {tool.name}: {tool.description}" for tool in self.tools)
+        print("\n".join(lines))
         return self.tools
     
     def get_project_info(self):
@@ -250,8 +445,8 @@ Always work within the current project directory: {context['project_path']}
             "is_git_repo": self.project_context["is_git_repo"],
             "languages": list(self.project_context["languages"]),
             "frameworks": list(self.project_context["frameworks"]),
-            "file_count": len(self.project_context["files"]),
-            "current_dir": os.getcwd()
+            "file_count": self.project_context["file_count"],
+            "current_dir": str(self.project_path)
         }
     
     def get_config(self):
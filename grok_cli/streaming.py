@@ -0,0 +1,36 @@
+"""
+Token streaming for Grok agents
+Prints LLM tokens to the terminal as they arrive
+"""
+
+import sys
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+class StdoutTokens(BaseCallbackHandler):
+    """Callback handler that writes each streamed LLM token to stdout"""
+
+    # Run on the calling thread/loop so tokens print in order under ainvoke
+    run_inline = True
+
+    def __init__(self):
+        super().__init__()
+        self.streamed = False
+
+    def on_llm_new_token(self, token, **kwargs):
+        if token:
+            sys.stdout.write(token)
+            sys.stdout.flush()
+            self.streamed = True
+
+    def finish(self, output):
+        """End the reply and return it, printing `output` if no tokens were streamed"""
+        if self.streamed:
+            print()
+        if not output:
+            output = "Sorry, I couldn't generate a response."
+            print(output)
+        elif not self.streamed:
+            print(output)
+        return output
@@ -1,16 +1,22 @@
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
+README = Path(__file__).parent / 'readme.md'
+
 setup(
     name='grok-cli',
     version='0.1.0',
-    packages=find_packages(),
+    packages=find_packages(include=['grok_cli', 'grok_cli.*']),
     install_requires=[
-        'click',
         'composio_core',
         'composio_langchain',
+        'httpx[http2]',
         'langchain',
         'langchain_openai',
         'langchain_community',
+        'prompt_toolkit',
+        'python-dotenv',
     ],
     entry_points={
         'console_scripts': [
@@ -19,6 +25,6 @@ setup(
     },
     author='Your Name',
     description='A CLI tool for interacting with xAI Grok 4',
-    long_description=open('readme.md').read(),
+    long_description=README.read_text(encoding='utf-8') if README.exists() else '',
     long_description_content_type='text/markdown',
 )
\ No newline at end of file